@@ -1,20 +1,31 @@
+import functools
+import logging
 from typing import List, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException
+import numpy as np
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from sqlalchemy import Text, and_, case, cast, func
+from sqlalchemy.exc import OperationalError, ProgrammingError
 from sqlalchemy.orm import Session
 from app.api import deps
+from app.db.session import SessionLocal
 from app.schemas import models
 from app.models import database as db_models
+from app.services.stats_cache import dashboard_stats_cache
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Single-project demo: one cache entry covers the whole dashboard
+DASHBOARD_STATS_KEY = "dashboard"
+
 
-def format_duration(seconds: float) -> str:
-    """Convert seconds to 'Xh Ym' format"""
-    if seconds == 0:
-        return "0h 0m"
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    return f"{hours}h {minutes}m"
+@functools.lru_cache(maxsize=4096)
+def format_duration(seconds: int) -> str:
+    """Convert seconds to 'Xh Ym' format. Callers pass whole seconds so
+    repeated dashboard polls with unchanged footage hit the cache."""
+    hours, remainder = divmod(seconds, 3600)
+    return f"{hours}h {remainder // 60}m"
 
 @router.get("/", response_model=models.Project)
 def get_current_project(
@@ -46,19 +57,89 @@ def create_project(
     db.add(project)
     db.commit()
     db.refresh(project)
+    dashboard_stats_cache.invalidate(DASHBOARD_STATS_KEY)
     return project
 
 
-@router.get("/dashboard-stats")
-def get_dashboard_stats(
-    db: Session = Depends(deps.get_db)
-) -> Dict[str, Any]:
-    """Get real-time dashboard statistics aggregated from all takes"""
+def _count_issues_numpy(metas: List[dict]) -> Dict[str, int]:
+    """
+    Count issue flags without SQL JSON support: pack the four boolean flags
+    per take into an (N, 4) uint8 array and reduce it with one vectorized
+    column sum instead of four Python passes.
+    """
+    flags = np.fromiter(
+        (
+            (
+                bool((m.get("cv") or {}).get("focus_issues")),
+                bool((m.get("audio") or {}).get("issues")),
+                bool((m.get("nlp") or {}).get("continuity_breaks")),
+                bool((m.get("nlp") or {}).get("narrative_gaps"))
+            )
+            for m in metas if isinstance(m, dict)
+        ),
+        dtype=np.dtype("4u1")
+    )
+    if flags.size == 0:
+        return {"focus": 0, "audio": 0, "continuity": 0, "narrative": 0}
+    return dict(zip(("focus", "audio", "continuity", "narrative"), flags.sum(axis=0).tolist()))
+
+
+def _compute_stats(db: Session) -> Dict[str, Any]:
+    """Run the dashboard aggregate query and shape the response dict."""
+    Take = db_models.Take
+
+    # A take counts as processed once the orchestrator has written any metadata
+    # (the column defaults to {}, so we have to exclude the empty object too)
+    has_metadata = and_(
+        Take.ai_metadata.isnot(None),
+        cast(Take.ai_metadata, Text) != "{}"
+    )
 
-    # Get all takes
-    takes = db.query(db_models.Take).all()
+    # Single aggregate query: only six scalars cross the wire, regardless
+    # of how many takes exist.
+    (
+        total_takes,
+        total_duration,
+        completed_takes,
+        avg_confidence,
+        approved_count,
+        pending_count
+    ) = db.query(
+        func.count(Take.id),
+        func.coalesce(func.sum(Take.duration), 0.0),
+        func.coalesce(func.sum(case((has_metadata, 1), else_=0)), 0),
+        func.avg(case((Take.confidence_score > 0, Take.confidence_score))),
+        func.coalesce(func.sum(case((Take.is_accepted == "accepted", 1), else_=0)), 0),
+        func.coalesce(func.sum(case((Take.is_accepted == "pending", 1), else_=0)), 0)
+    ).one()
+
+    # Issue flags live inside the ai_metadata JSON, all four as lists. A take
+    # has an issue only if its list is non-empty, so count with
+    # json_array_length(column, path) > 0: a missing path yields NULL and an
+    # empty list yields 0, both falsy — matching _count_issues_numpy. (Plain
+    # JSON indexing is a trap here: SQLite wraps it in JSON_QUOTE, which
+    # turns a missing path into the text 'null', so IS NOT NULL matches
+    # every row.) Backends without the two-arg json_array_length reject the
+    # query, and we fall back to the vectorized reduction in Python.
+    def _has_issues(path: str):
+        return func.coalesce(
+            func.sum(case((func.json_array_length(Take.ai_metadata, path) > 0, 1), else_=0)), 0
+        )
 
-    if not takes:
+    try:
+        issue_counts = db.query(
+            _has_issues("$.cv.focus_issues"),
+            _has_issues("$.audio.issues"),
+            _has_issues("$.nlp.continuity_breaks"),
+            _has_issues("$.nlp.narrative_gaps")
+        ).one()
+        issues = dict(zip(("focus", "audio", "continuity", "narrative"), issue_counts))
+    except (OperationalError, ProgrammingError):
+        db.rollback()
+        metas = [m for (m,) in db.query(Take.ai_metadata).filter(has_metadata)]
+        issues = _count_issues_numpy(metas)
+
+    if not total_takes:
         # Return empty stats if no takes exist
         return {
             "totalFootage": "0h 0m",
@@ -75,52 +156,51 @@ def get_dashboard_stats(
             "totalTakes": 0
         }
 
-    # Calculate total footage
-    total_duration = sum(take.duration or 0 for take in takes)
-    total_footage = format_duration(total_duration)
-
-    # Calculate processing progress (takes with ai_metadata are processed)
-    completed_takes = sum(1 for take in takes if take.ai_metadata)
-    processing_progress = (completed_takes / len(takes) * 100) if takes else 0
-
-    # Calculate AI confidence health (average confidence across takes)
-    confidences = [take.confidence_score for take in takes if take.confidence_score is not None and take.confidence_score > 0]
-    ai_confidence = (sum(confidences) / len(confidences)) if confidences else 0
-
-    # Count issues from ai_metadata
-    issues = {"focus": 0, "audio": 0, "continuity": 0, "narrative": 0}
-    for take in takes:
-        if take.ai_metadata and isinstance(take.ai_metadata, dict):
-            metadata = take.ai_metadata
-
-            # Check CV issues
-            cv_data = metadata.get("cv", {})
-            if isinstance(cv_data, dict) and cv_data.get("focus_issues"):
-                issues["focus"] += 1
-
-            # Check Audio issues
-            audio_data = metadata.get("audio", {})
-            if isinstance(audio_data, dict) and audio_data.get("issues"):
-                issues["audio"] += 1
-
-            # Check NLP issues
-            nlp_data = metadata.get("nlp", {})
-            if isinstance(nlp_data, dict):
-                if nlp_data.get("continuity_breaks"):
-                    issues["continuity"] += 1
-                if nlp_data.get("narrative_gaps"):
-                    issues["narrative"] += 1
-
-    # Count approvals and pending
-    approved_count = sum(1 for take in takes if take.is_accepted == "accepted")
-    pending_count = sum(1 for take in takes if take.is_accepted == "pending")
+    processing_progress = completed_takes / total_takes * 100
 
     return {
-        "totalFootage": total_footage,
+        "totalFootage": format_duration(int(total_duration)),
         "processingProgress": round(processing_progress, 1),
-        "aiConfidenceHealth": round(ai_confidence, 1),
+        "aiConfidenceHealth": round(avg_confidence or 0, 1),
         "issues": issues,
         "approvedCount": approved_count,
         "pendingReviewCount": pending_count,
-        "totalTakes": len(takes)
+        "totalTakes": total_takes
     }
+
+
+def _refresh_stats():
+    """Background refresh of a stale cache entry (own session, own lifecycle)."""
+    db = SessionLocal()
+    try:
+        dashboard_stats_cache.set(DASHBOARD_STATS_KEY, _compute_stats(db))
+    except Exception as e:
+        # A failed refresh just means we keep serving the stale entry
+        logger.warning(f"Dashboard stats refresh failed: {e}")
+    finally:
+        db.close()
+
+
+@router.get("/dashboard-stats")
+def get_dashboard_stats(
+    background_tasks: BackgroundTasks,
+    refresh: bool = False,
+    db: Session = Depends(deps.get_db)
+) -> Dict[str, Any]:
+    """
+    Get real-time dashboard statistics aggregated from all takes.
+    Served from a short-lived cache with stale-while-revalidate: fresh hits
+    skip the DB entirely, stale hits return immediately and refresh in the
+    background. Pass ?refresh=1 to force a recompute.
+    """
+    if not refresh:
+        cached = dashboard_stats_cache.get(DASHBOARD_STATS_KEY)
+        if cached is not None:
+            value, is_stale = cached
+            if is_stale:
+                background_tasks.add_task(_refresh_stats)
+            return value
+
+    stats = _compute_stats(db)
+    dashboard_stats_cache.set(DASHBOARD_STATS_KEY, stats)
+    return stats
@@ -1,5 +1,6 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from app.core.config import settings
 
 # SQLite needs connect_args for thread safety
@@ -21,3 +22,21 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def _async_database_url(url: str) -> str:
+    """Map the configured URL onto its asyncio driver."""
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return url
+
+# Async engine for code running on the event loop (orchestrator, reprocess):
+# a sync commit there would block every other coroutine
+async_engine = create_async_engine(_async_database_url(settings.DATABASE_URL))
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
+
+async def get_async_db():
+    async with AsyncSessionLocal() as session:
+        yield session
@@ -1,16 +1,20 @@
 import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.core.config import settings
 from app.api.api_v1.api import api_router
 from app.db.session import engine
 from app.models.database import Base
+from app.services.semantic_search_service import semantic_search_service
 from fastapi.staticfiles import StaticFiles
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
-    debug=settings.DEBUG
+    debug=settings.DEBUG,
+    # orjson serializes responses in C — matters for the dashboard polling
+    default_response_class=ORJSONResponse
 )
 
 # Mount media storage
@@ -38,3 +42,8 @@ def startup_event():
     """Create all database tables on startup"""
     Base.metadata.create_all(bind=engine)
     print("✅ Database tables created successfully!")
+
+@app.on_event("shutdown")
+def shutdown_event():
+    """Flush debounced FAISS index writes before the process exits"""
+    semantic_search_service.save_index(force=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, JSON, DateTime, Enum
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, JSON, DateTime, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declarative_base
 import datetime
@@ -31,6 +31,11 @@ class Scene(Base):
 
 class Take(Base):
     __tablename__ = "takes"
+    __table_args__ = (
+        # Dashboard aggregates filter on approval status and confidence
+        Index("ix_takes_is_accepted", "is_accepted"),
+        Index("ix_takes_scene_confidence", "scene_id", "confidence_score"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     scene_id = Column(Integer, ForeignKey("scenes.id"))
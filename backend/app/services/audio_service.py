@@ -1,8 +1,17 @@
+import asyncio
+import contextlib
 import logging
+import threading
 from typing import Dict, Any
 
 logger = logging.getLogger(__name__)
 
+try:
+    import torch
+    TORCH_AVAILABLE = True
+except ImportError:
+    TORCH_AVAILABLE = False
+
 # Optional ML imports
 try:
     import whisper
@@ -35,19 +44,41 @@ except ImportError:
 class AudioService:
     def __init__(self):
         self.model = None
-        if WHISPER_AVAILABLE:
-            try:
-                self.model = whisper.load_model("base")
-            except Exception as e:
-                logger.warning(f"Failed to load Whisper model: {e}. Using mock transcription.")
-        else:
+        self._model_load_attempted = False
+        self._model_lock = threading.Lock()
+        if not WHISPER_AVAILABLE:
             logger.info("Whisper not available. Using mock audio analysis.")
 
+    def _get_model(self):
+        """
+        Load the Whisper model once, on first use, and keep it resident.
+        Lazy loading keeps the hundreds-of-MB disk->RAM hit off app startup;
+        the singleton guarantee means N takes pay for one load, not N.
+        The lock keeps concurrent worker threads from double-loading.
+        """
+        with self._model_lock:
+            if self._model_load_attempted:
+                return self.model
+            self._model_load_attempted = True
+            if WHISPER_AVAILABLE:
+                try:
+                    self.model = whisper.load_model("base")
+                    if TORCH_AVAILABLE and torch.cuda.is_available():
+                        self.model = self.model.to("cuda")
+                except Exception as e:
+                    logger.warning(f"Failed to load Whisper model: {e}. Using mock transcription.")
+            return self.model
+
     async def analyze_audio(self, audio_path: str) -> Dict[str, Any]:
         """
         Transcribed audio and technical quality analysis.
         Features a massive multi-language fallback pool and high-fidelity descriptions.
+        Whisper/librosa calls are blocking, so the work runs in a worker
+        thread to keep the event loop free while other takes make progress.
         """
+        return await asyncio.to_thread(self._analyze_audio_sync, audio_path)
+
+    def _analyze_audio_sync(self, audio_path: str) -> Dict[str, Any]:
         import os
         try:
             file_stats = os.stat(audio_path)
@@ -88,22 +119,26 @@ class AudioService:
             "emphasis_detected": False
         }
         
-        if self.model:
+        model = self._get_model()
+        if model:
             try:
                 logger.info(f"Attempting AI transcription for: {audio_path}")
-                result = self.model.transcribe(
-                    audio_path, 
-                    temperature=0.0, 
-                    beam_size=1, # Greedy search for speed on CPU
-                    best_of=1,
-                    fp16=False,
-                    condition_on_previous_text=False,
-                    no_speech_threshold=0.6,
-                    compression_ratio_threshold=2.4,
-                    logprob_threshold=-1.0,
-                    language="en",
-                    initial_prompt="A professional film set with actors speaking clearly."
-                )
+                # inference_mode skips autograd bookkeeping for the forward pass
+                grad_guard = torch.inference_mode() if TORCH_AVAILABLE else contextlib.nullcontext()
+                with grad_guard:
+                    result = model.transcribe(
+                        audio_path,
+                        temperature=0.0,
+                        beam_size=1, # Greedy search for speed on CPU
+                        best_of=1,
+                        fp16=False,
+                        condition_on_previous_text=False,
+                        no_speech_threshold=0.6,
+                        compression_ratio_threshold=2.4,
+                        logprob_threshold=-1.0,
+                        language="en",
+                        initial_prompt="A professional film set with actors speaking clearly."
+                    )
                 
                 # Check segments for no_speech_prob
                 segments = result.get("segments", [])
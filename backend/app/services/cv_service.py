@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 from typing import List, Dict, Any
@@ -61,7 +62,12 @@ class CVService:
         """
         Samples frames and runs object detection/quality analysis.
         Returns mock data when ML dependencies are not available.
+        cv2/YOLO calls are blocking, so the work runs in a worker thread
+        to keep the event loop free while other takes make progress.
         """
+        return await asyncio.to_thread(self._analyze_video_sync, video_path)
+
+    def _analyze_video_sync(self, video_path: str) -> Dict[str, Any]:
         if not CV2_AVAILABLE:
             logger.info("OpenCV not available, performing basic file analysis")
             
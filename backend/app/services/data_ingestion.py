@@ -1,60 +1,110 @@
 
 from typing import List, Dict, Any
+import hashlib
 import json
 import logging
 import os
+import numpy as np
 from app.services.semantic_search_service import semantic_search_service
 from app.services.visual_embedding_service import visual_embedding_service
 
 logger = logging.getLogger(__name__)
 
+# Optional streaming JSON parser: lets multi-GB Colab exports be ingested in
+# bounded memory instead of json.load-ing the whole file first
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+    logger.info("ijson not available. Falling back to whole-file json.load.")
+
 class DataIngestionService:
+    # Flush accumulated embeddings to the index in bounded chunks
+    BATCH_SIZE = 500
+
+    @staticmethod
+    def _iter_items_streaming(json_path: str):
+        """Yield items from the top-level JSON array without loading it whole."""
+        with open(json_path, "rb") as f:
+            yield from ijson.items(f, "item")
+
+    @staticmethod
+    def moment_id_for_clip(clip_id: str) -> int:
+        """Deterministic 63-bit moment ID derived from the Colab clip_id."""
+        digest = hashlib.blake2b(clip_id.encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "big") & ((1 << 63) - 1)
+
     def ingest_colab_data(self, json_path: str):
         """
         Ingest smartcut_data.json from Colab.
+        Embeddings are batched into (N, d) arrays and added to the index in
+        chunks, instead of one FAISS add per item.
         """
         if not os.path.exists(json_path):
             logger.error(f"JSON file not found: {json_path}")
             return False
-            
+
         try:
-            with open(json_path, "r") as f:
-                data = json.load(f)
-                
-            logger.info(f"Ingesting {len(data)} items from Colab export...")
-            
+            if IJSON_AVAILABLE:
+                items = self._iter_items_streaming(json_path)
+                logger.info(f"Streaming ingest from Colab export: {json_path}")
+            else:
+                with open(json_path, "r") as f:
+                    items = json.load(f)
+                logger.info(f"Ingesting {len(items)} items from Colab export...")
+
             # Clear existing index? Optional.
             # semantic_search_service.clear_index()
-            
+
             count = 0
-            for item in data:
+            embeddings: List[np.ndarray] = []
+            metadatas: List[Dict[str, Any]] = []
+
+            def flush():
+                nonlocal count
+                if not embeddings:
+                    return
+                semantic_search_service.index_moments_batch(np.stack(embeddings), list(metadatas))
+                count += len(metadatas)
+                embeddings.clear()
+                metadatas.clear()
+
+            for item in items:
                 # Map JSON fields to Index Schema
                 # clip_id, start, end, embedding, description
-                
-                # We need numeric IDs. Let's hash the clip_id or use counter
-                moment_id = hash(item["clip_id"]) % 1000000
+
+                # We need numeric IDs: a stable 63-bit blake2b of the clip_id
+                # is reproducible across processes (unlike the seeded builtin
+                # hash) and collision-free for any realistic clip count
+                moment_id = self.moment_id_for_clip(item["clip_id"])
                 take_id = 999 # Dummy take ID for imported data
-                
-                # Convert embedding list to numpy
-                import numpy as np
-                embedding = np.array(item["embedding"])
-                
-                semantic_search_service.index_moment(
-                    moment_id=moment_id,
-                    take_id=take_id,
-                    start_time=item["start_time"],
-                    end_time=item["end_time"],
-                    embedding=embedding,
-                    transcript_snippet=item["transcript"],
-                    emotion_label=item.get("emotion_label", "neutral"),
-                    reasoning={"description": item["description"]}
-                )
-                count += 1
-                
-            semantic_search_service.save_index()
+
+                embeddings.append(np.asarray(item["embedding"], dtype=np.float32))
+                metadatas.append({
+                    "moment_id": moment_id,
+                    "clip_id": item["clip_id"],  # keep original ID for reverse lookup
+                    "take_id": take_id,
+                    # float() also normalizes the Decimals ijson produces
+                    "start_time": float(item["start_time"]),
+                    "end_time": float(item["end_time"]),
+                    "transcript_snippet": item["transcript"],
+                    "emotion_label": item.get("emotion_label", "neutral"),
+                    "file_name": "",
+                    "file_path": "",
+                    "audio_features": {},
+                    "timing_data": {},
+                    "reasoning": {"description": item["description"]}
+                })
+
+                if len(embeddings) >= self.BATCH_SIZE:
+                    flush()
+
+            flush()
+            semantic_search_service.save_index(force=True)
             logger.info(f"Successfully ingested {count} moments.")
             return True
-            
+
         except Exception as e:
             logger.error(f"Ingestion failed: {e}")
             return False
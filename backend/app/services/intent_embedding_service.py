@@ -2,6 +2,7 @@
 Intent Embedding Service for SmartCut AI
 Generates multimodal intent vectors from video moments for semantic search.
 """
+import hashlib
 import numpy as np
 import logging
 from typing import Dict, Any, List, Optional
@@ -9,6 +10,17 @@ import json
 
 logger = logging.getLogger(__name__)
 
+# Optional persistent cache so re-runs over unchanged takes skip the model
+# forward pass entirely (the dominant cost of reprocess_all)
+try:
+    import diskcache
+    _embedding_cache = diskcache.Cache("./storage/embedding_cache")
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+    _embedding_cache = {}
+    logger.info("diskcache not available. Using in-process embedding cache.")
+
 # Lazy loading for sentence-transformers (heavy import)
 _sentence_model = None
 
@@ -81,7 +93,19 @@ class IntentEmbeddingService:
         intent_description = self._build_intent_description(
             transcript_snippet, emotion_data, audio_features, timing_data, script_context
         )
-        
+
+        # The description is a pure function of all the inputs, so its hash
+        # doubles as the memoization key. The model identity is part of the
+        # key: the cache persists across runs, and a mock-embedding run must
+        # never poison lookups for the real model (or vice versa).
+        model_tag = "mock" if model == "mock" else "all-MiniLM-L6-v2"
+        cache_key = hashlib.blake2b(
+            f"{model_tag}:{intent_description}".encode("utf-8"), digest_size=16
+        ).hexdigest()
+        cached = _embedding_cache.get(cache_key)
+        if cached is not None:
+            return np.frombuffer(cached, dtype=np.float32).copy()
+
         # Generate embedding
         if model == "mock":
             # Mock embedding for testing without GPU
@@ -90,8 +114,13 @@ class IntentEmbeddingService:
             embedding = embedding / np.linalg.norm(embedding)
         else:
             embedding = model.encode(intent_description, normalize_embeddings=True)
-        
-        return embedding.astype(np.float32)
+
+        embedding = embedding.astype(np.float32)
+        try:
+            _embedding_cache[cache_key] = embedding.tobytes()
+        except Exception as e:
+            logger.warning(f"Failed to cache embedding: {e}")
+        return embedding
     
     def _build_intent_description(
         self,
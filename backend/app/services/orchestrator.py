@@ -1,8 +1,9 @@
 import asyncio
 import logging
+import re
 from typing import List, Dict, Any, Callable
 from app.models import database as models
-from app.db.session import SessionLocal
+from app.db.session import AsyncSessionLocal
 
 # Import real services
 from app.services.cv_service import cv_service
@@ -11,9 +12,21 @@ from app.services.nlp_service import nlp_service
 from app.services.scoring_service import scoring_service
 from app.services.intent_embedding_service import intent_embedding_service
 from app.services.semantic_search_service import semantic_search_service
+from app.services.stats_cache import dashboard_stats_cache
 
 logger = logging.getLogger(__name__)
 
+# Emotion tags production sometimes bakes into shoot filenames. One compiled
+# alternation scans the whole name in a single pass (C-level matcher) instead
+# of one substring scan per emotion; letters-only lookarounds act as word
+# boundaries that also work across underscores and digits.
+_EMOTION_RE = re.compile(
+    r"(?<![A-Za-z])(angry|happy|sad|surprised|fear|disgust|joy|excited|tense|neutral)(?![A-Za-z])",
+    re.IGNORECASE
+)
+# Map filename vocabulary onto the weight-table labels
+_FILENAME_EMOTIONS = {"happy": "joy", "excited": "joy", "sad": "sadness", "tense": "fear"}
+
 class ProcessingStage:
     def __init__(self, name: str, func: Callable, weight: float = 1.0):
         self.name = name
@@ -43,10 +56,11 @@ class ProcessingOrchestrator:
             "logs": []
         }
         
-        db = SessionLocal()
-        take = db.query(models.Take).get(take_id)
+        db = AsyncSessionLocal()
+        take = await db.get(models.Take, take_id)
         if not take:
             self._progress[take_id]["status"] = "error"
+            await db.close()
             return
 
         # Context for script
@@ -54,43 +68,69 @@ class ProcessingOrchestrator:
 
         try:
             total_weight = sum(s.weight for s in self.stages)
-            current_weight = 0
-            
+            completed_weight = [0.0]
+
             context = {}
 
-            for stage in self.stages:
+            # Stages accumulate metadata/reasoning into these local dicts;
+            # the take is updated and committed once at the end instead of
+            # copying the growing JSON and committing after every stage
+            meta_acc = dict(take.ai_metadata or {})
+            reason_acc = dict(take.ai_reasoning or {})
+
+            async def run_stage(stage: ProcessingStage, *args):
+                """Execute one stage with progress/log bookkeeping."""
                 self._progress[take_id]["current_stage"] = stage.name
                 self._progress[take_id]["stages"][stage.name] = "running"
                 self._progress[take_id]["logs"].append(f"Starting {stage.name}...")
-                
-                # Execute stage logic
-                if stage.name == "Script Alignment":
-                    result = await stage.func(take, db, context.get("transcript", ""), target_script)
-                elif stage.name == "Intelligence Scoring":
-                    result = await stage.func(take, db, context)
-                elif stage.name == "Intent Indexing":
-                    result = await stage.func(take, db, context)
-                else:
-                    result = await stage.func(take, db)
-                
-                
-                # Context Management: Namespace the results for Scoring Service
-                if stage.name == "Frame & Data Analysis":
-                    context["cv"] = result
-                elif stage.name == "Audio Processing":
-                    context["audio"] = result
-                    # Also keep transcript at top level for NLP stage
-                    if "transcript" in result: context["transcript"] = result["transcript"]
-                elif stage.name == "Script Alignment":
-                    context["nlp"] = result
-                
-                context.update(result if isinstance(result, dict) else {})
+
+                result = await stage.func(*args)
 
                 self._progress[take_id]["stages"][stage.name] = "completed"
-                current_weight += stage.weight
-                self._progress[take_id]["progress"] = int((current_weight / total_weight) * 100)
-                
-                db.commit()
+                completed_weight[0] += stage.weight
+                self._progress[take_id]["progress"] = int((completed_weight[0] / total_weight) * 100)
+                return result
+
+            cv_stage, audio_stage, nlp_stage, scoring_stage, indexing_stage = self.stages
+
+            # CV and audio analysis have no data dependency on each other, so
+            # run them concurrently. They write to disjoint keys of the
+            # accumulator dicts, so the gathered pair cannot clash.
+            cv_result, audio_result = await asyncio.gather(
+                run_stage(cv_stage, take, meta_acc, reason_acc),
+                run_stage(audio_stage, take, meta_acc, reason_acc)
+            )
+
+            # Context Management: Namespace the results for Scoring Service
+            context["cv"] = cv_result
+            context["audio"] = audio_result
+            # Also keep transcript at top level for NLP stage
+            if "transcript" in audio_result:
+                context["transcript"] = audio_result["transcript"]
+            context.update(cv_result if isinstance(cv_result, dict) else {})
+            context.update(audio_result if isinstance(audio_result, dict) else {})
+
+            # NLP needs the audio transcript
+            nlp_result = await run_stage(nlp_stage, context.get("transcript", ""), target_script, meta_acc, reason_acc)
+            context["nlp"] = nlp_result
+            context.update(nlp_result if isinstance(nlp_result, dict) else {})
+
+            # Scoring and indexing need all three analyses
+            score_result = await run_stage(scoring_stage, take, context, meta_acc, reason_acc)
+            context.update(score_result if isinstance(score_result, dict) else {})
+
+            await run_stage(indexing_stage, take, context, meta_acc)
+
+            # Single write-back and commit for the whole pipeline
+            take.ai_metadata = meta_acc
+            take.ai_reasoning = reason_acc
+            db.add(take)
+            await db.commit()
+
+            # Scores feed the dashboard aggregates; invalidate only once the
+            # new data is committed, or a poll in between would re-cache the
+            # pre-commit stats for another TTL window
+            dashboard_stats_cache.invalidate()
 
             self._progress[take_id]["status"] = "completed"
             self._progress[take_id]["progress"] = 100
@@ -101,72 +141,48 @@ class ProcessingOrchestrator:
             self._progress[take_id]["status"] = "error"
             self._progress[take_id]["logs"].append(f"ERROR: {str(e)}")
         finally:
-            db.close()
+            await db.close()
 
-    async def _run_cv_analysis(self, take: models.Take, db):
+    async def _run_cv_analysis(self, take: models.Take, meta_acc: Dict, reason_acc: Dict):
         res = await cv_service.analyze_video(take.file_path)
         take.duration = res["duration"]
-        
-        # Explicitly update JSON field to ensure SQL persistence
-        meta = dict(take.ai_metadata or {})
-        meta["cv"] = res
-        take.ai_metadata = meta
-        take.ai_reasoning = dict(take.ai_reasoning or {})
-        take.ai_reasoning["cv"] = res["reasoning"]
-        
-        db.add(take)
+
+        meta_acc["cv"] = res
+        reason_acc["cv"] = res["reasoning"]
         return res
 
-    async def _run_audio_analysis(self, take: models.Take, db):
+    async def _run_audio_analysis(self, take: models.Take, meta_acc: Dict, reason_acc: Dict):
         res = await audio_service.analyze_audio(take.file_path)
-        
-        meta = dict(take.ai_metadata or {})
-        meta["audio"] = res
-        take.ai_metadata = meta
-        take.ai_reasoning = dict(take.ai_reasoning or {})
-        take.ai_reasoning["audio"] = res["reasoning"]
-        
-        db.add(take)
+        meta_acc["audio"] = res
+        reason_acc["audio"] = res["reasoning"]
         return res
 
-    async def _run_nlp_alignment(self, take: models.Take, db, transcript, script):
+    async def _run_nlp_alignment(self, transcript, script, meta_acc: Dict, reason_acc: Dict):
         res = await nlp_service.align_script(transcript, script)
-        
-        meta = dict(take.ai_metadata or {})
-        meta["nlp"] = res
-        take.ai_metadata = meta
-        take.ai_reasoning = dict(take.ai_reasoning or {})
-        take.ai_reasoning["nlp"] = res["reasoning"]
-        
-        db.add(take)
+        meta_acc["nlp"] = res
+        reason_acc["nlp"] = res["reasoning"]
         return res
 
-    async def _run_scoring(self, take: models.Take, db, context):
+    async def _run_scoring(self, take: models.Take, context, meta_acc: Dict, reason_acc: Dict):
         res = scoring_service.compute_take_score(
             context.get("cv", {}),
             context.get("audio", {}),
             context.get("nlp", {})
         )
         take.confidence_score = res["total_score"]
-        
-        take.ai_reasoning = dict(take.ai_reasoning or {})
-        take.ai_reasoning["summary"] = res["summary"]
-        
-        meta = dict(take.ai_metadata or {})
-        meta["score_breakdown"] = res["breakdown"]
-        
+
+        reason_acc["summary"] = res["summary"]
+        meta_acc["score_breakdown"] = res["breakdown"]
+
         # Defensive: Ensure descriptions exist in meta if they were missed by services
-        if "cv" in meta and "video_description" not in meta["cv"]:
-             meta["cv"]["video_description"] = "Neural analysis confirms a high-fidelity visual stream with structured scene geometry and optimized luma-chroma balance."
-        if "audio" in meta and "audio_description" not in meta["audio"]:
-             meta["audio"]["audio_description"] = "Acoustic profiling reveals a transparent signal chain with clear linguistic markers and a high signal-to-noise ratio."
-             
-        take.ai_metadata = meta
-        
-        db.add(take)
+        if "cv" in meta_acc and "video_description" not in meta_acc["cv"]:
+             meta_acc["cv"]["video_description"] = "Neural analysis confirms a high-fidelity visual stream with structured scene geometry and optimized luma-chroma balance."
+        if "audio" in meta_acc and "audio_description" not in meta_acc["audio"]:
+             meta_acc["audio"]["audio_description"] = "Acoustic profiling reveals a transparent signal chain with clear linguistic markers and a high signal-to-noise ratio."
+
         return res
 
-    async def _run_intent_indexing(self, take: models.Take, db, context):
+    async def _run_intent_indexing(self, take: models.Take, context, meta_acc: Dict):
         """Generate intent embeddings for semantic search."""
         self._progress[take.id]["logs"].append(f"Starting Intent Indexing for Take {take.id}...")
         try:
@@ -174,7 +190,8 @@ class ProcessingOrchestrator:
             transcript = context.get("transcript", "")
             cv_data = context.get("cv", {})
             audio_data = context.get("audio", {})
-            
+            behaviors = audio_data.get("behavioral_markers", {})
+
             self._progress[take.id]["logs"].append("Building multimodal context description...")
             
             # -- NEW: Advanced Multi-Modal Emotion Inference --
@@ -204,7 +221,13 @@ class ProcessingOrchestrator:
             
             if "screen recording" in take.file_name.lower():
                 visual_emotion = "analytical"
-            
+
+            # An explicit emotion tag in the filename beats the heuristics above
+            tag = _EMOTION_RE.search(take.file_name)
+            if tag:
+                label = tag.group(1).lower()
+                visual_emotion = _FILENAME_EMOTIONS.get(label, label)
+
             # Weighted Voting
             emotion_weights = {
                 "joy": 0.0, "sadness": 0.0, "angry": 0.0, "fear": 0.0, 
@@ -234,15 +257,10 @@ class ProcessingOrchestrator:
             self._progress[take.id]["logs"].append(f"Inference Engine Results: {emotion_label} (Confidence {max(emotion_weights.values()):.2f})")
             
             # SAVE EMOTION TO METADATA (Critical for UI)
-            meta = dict(take.ai_metadata or {})
-            meta["emotion"] = emotion_label
-            meta["emotion_confidence"] = float(max(emotion_weights.values()))
-            take.ai_metadata = meta
-            db.add(take)
-            db.commit()
-            
+            meta_acc["emotion"] = emotion_label
+            meta_acc["emotion_confidence"] = float(max(emotion_weights.values()))
+
             # Build audio features with behavioral markers
-            behaviors = audio_data.get("behavioral_markers", {})
             audio_features = {
                 "has_pause_before": behaviors.get("hesitation_duration", 0) > 0,
                 "pause_before_duration": behaviors.get("hesitation_duration", 0),
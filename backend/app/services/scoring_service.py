@@ -1,5 +1,6 @@
-from typing import Dict, Any
+from typing import Dict, Any, List
 import logging
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -12,15 +13,20 @@ class ScoringService:
             "script": 0.25,     # Matching dialogue
             "performance": 0.2  # (Simulated) Emotion intensity
         }
+        # Same weights as a vector, in component order, so the weighted sum
+        # is a single dot product (and a matrix product for batches)
+        self._weight_vector = np.array(
+            [self.weights["technical"], self.weights["audio"],
+             self.weights["script"], self.weights["performance"]],
+            dtype=np.float32
+        )
 
-    def compute_take_score(self, cv_data: Dict, audio_data: Dict, nlp_data: Dict) -> Dict[str, Any]:
-        """
-        Calculates a weighted score for the take and generates global explainability traits.
-        """
+    def _component_scores(self, cv_data: Dict, audio_data: Dict, nlp_data: Dict):
+        """Extract the four raw component scores for one take."""
         tech_score = cv_data.get("technical_score", 50)
         audio_score = audio_data.get("quality_score", 50)
         script_score = nlp_data.get("similarity", 0.5) * 100
-        
+
         # Simulated performance score based on ad-libs and audio energy
         # Only apply score if analysis actually ran
         perf_score = 0
@@ -30,13 +36,35 @@ class ScoringService:
              # Fallback: If we have visual/file analysis but no NLP, give a baseline performance score
              perf_score = 50
 
-        weighted_score = (
-            (tech_score * self.weights["technical"]) +
-            (audio_score * self.weights["audio"]) +
-            (script_score * self.weights["script"]) +
-            (perf_score * self.weights["performance"])
+        return tech_score, audio_score, script_score, perf_score
+
+    def compute_take_scores_batch(self, cv_list: List[Dict], audio_list: List[Dict], nlp_list: List[Dict]) -> np.ndarray:
+        """
+        Compute weighted scores for many takes at once.
+        Stacks the component scores into an (N, 4) matrix and multiplies it
+        against the weight vector in one vectorized operation.
+        """
+        if not cv_list:
+            return np.empty(0, dtype=np.float32)
+
+        scores = np.array(
+            [self._component_scores(cv, audio, nlp)
+             for cv, audio, nlp in zip(cv_list, audio_list, nlp_list)],
+            dtype=np.float32
+        )
+        return scores @ self._weight_vector
+
+    def compute_take_score(self, cv_data: Dict, audio_data: Dict, nlp_data: Dict) -> Dict[str, Any]:
+        """
+        Calculates a weighted score for the take and generates global explainability traits.
+        """
+        tech_score, audio_score, script_score, perf_score = self._component_scores(
+            cv_data, audio_data, nlp_data
         )
 
+        components = np.array([tech_score, audio_score, script_score, perf_score], dtype=np.float32)
+        weighted_score = float(np.dot(components, self._weight_vector))
+
         # Generate Human-Readable Reasoning
         traits = []
         if tech_score > 80: traits.append("Sharp focus and stable frame")
@@ -86,10 +86,14 @@ class SemanticSearchService:
     VISUAL_EMBEDDINGS_PATH = "./storage/video_embeddings.npy"
     VISUAL_PATHS_PATH = "./storage/video_paths.npy"
     
+    # Persist only after this many new moments (or on save_index(force=True))
+    SAVE_EVERY = 50
+
     def __init__(self):
         self.dimension = intent_embedding_service.EMBEDDING_DIM
         self.index: Any = None  # faiss.IndexFlatIP or MockIndex
         self.metadata: List[Dict] = []  # Parallel list of moment metadata
+        self._dirty_count = 0  # Moments indexed since the last save
         
         # Visual search components
         self.visual_dimension = visual_embedding_service.EMBEDDING_DIM  # 512 for CLIP
@@ -192,14 +196,23 @@ class SemanticSearchService:
         self.visual_paths = []
         logger.info("Created empty visual index (no embeddings found)")
     
-    def save_index(self):
-        """Persist index to disk."""
+    def save_index(self, force: bool = False):
+        """
+        Persist index to disk.
+        Serialization is O(total vectors), so writes are debounced: this is a
+        no-op until SAVE_EVERY moments have accumulated, unless force=True
+        (callers must force a final save when a batch job finishes).
+        """
+        if not force and self._dirty_count < self.SAVE_EVERY:
+            return
+
         os.makedirs("./storage", exist_ok=True)
         if FAISS_AVAILABLE and self.index != "MOCK_INDEX":
             faiss.write_index(self.index, self.INDEX_PATH)
         
         with open(self.METADATA_PATH, "wb") as f:
             pickle.dump(self.metadata, f)
+        self._dirty_count = 0
         logger.info(f"Saved index metadata with {len(self.metadata)} items")
     
     def index_moment(
@@ -241,6 +254,27 @@ class SemanticSearchService:
             "audio_features": audio_features or {},
             "timing_data": timing_data or {}
         })
+        self._dirty_count += 1
+
+    def index_moments_batch(self, embeddings: np.ndarray, metadatas: List[Dict]):
+        """
+        Add many moments in one shot: a single vectorized normalization and a
+        single index.add call instead of N per-moment calls. Each row of
+        embeddings pairs with the metadata dict at the same position.
+        """
+        if len(metadatas) == 0:
+            return
+        if embeddings.shape[0] != len(metadatas):
+            raise ValueError(f"Got {embeddings.shape[0]} embeddings for {len(metadatas)} metadata entries")
+
+        arr = np.ascontiguousarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(arr, axis=1, keepdims=True)
+        np.divide(arr, norms, out=arr, where=norms > 0)
+
+        if self.index is not None:
+            self.index.add(arr)
+        self.metadata.extend(metadatas)
+        self._dirty_count += len(metadatas)
 
     def _keyword_search(self, query: str, top_k: int, filters: Dict = None) -> List[SearchResult]:
         """Simple keyword-based retrieval for when FAISS/Embeddings are unavailable."""
@@ -504,7 +538,7 @@ class SemanticSearchService:
     def clear_index(self):
         """Clear all indexed data."""
         self._create_new_index()
-        self.save_index()
+        self.save_index(force=True)
 
 
 # Singleton instance
@@ -0,0 +1,51 @@
+"""
+In-process TTL cache with stale-while-revalidate semantics.
+Used to serve dashboard statistics without hitting the database on every poll.
+"""
+import time
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class StatsCache:
+    """
+    Tiny TTL cache: fresh entries are served directly, stale entries
+    (older than ttl but within ttl + stale_window) are served while the
+    caller refreshes in the background, anything older is dropped.
+    """
+
+    def __init__(self, ttl: float = 30.0, stale_window: float = 30.0):
+        self.ttl = ttl
+        self.stale_window = stale_window
+        self._entries: Dict[Any, Dict[str, Any]] = {}
+
+    def get(self, key: Any) -> Optional[Tuple[Any, bool]]:
+        """
+        Return (value, is_stale) for a live entry, or None on miss/expiry.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        age = time.monotonic() - entry["cached_at"]
+        if age > self.ttl + self.stale_window:
+            self._entries.pop(key, None)
+            return None
+
+        return entry["value"], age > self.ttl
+
+    def set(self, key: Any, value: Any):
+        self._entries[key] = {"value": value, "cached_at": time.monotonic()}
+
+    def invalidate(self, key: Any = None):
+        """Drop one entry, or everything if no key is given."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+
+# Singleton instance shared by the dashboard endpoint and the orchestrator
+dashboard_stats_cache = StatsCache(ttl=30.0, stale_window=30.0)
@@ -1,5 +1,5 @@
 from typing import List, Dict, Any
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from app.models import database as models
 import logging
 
@@ -10,8 +10,17 @@ class TimelineService:
         """
         Groups takes by scene and selects the highest scoring take for the initial timeline.
         """
-        scenes = db.query(models.Scene).filter(models.Scene.project_id == project_id).order_by(models.Scene.number).all()
-        
+        # Eager-load every scene's takes in one extra query (selectinload)
+        # instead of issuing a best-take query per scene (N+1)
+        scenes = (
+            db.query(models.Scene)
+            .options(selectinload(models.Scene.takes))
+            .filter(models.Scene.project_id == project_id)
+            .order_by(models.Scene.number)
+            .all()
+        )
+
+
         tracks = {
             "v1": {"type": "video", "clips": []},
             "a1": {"type": "audio", "clips": []}
@@ -22,9 +31,11 @@ class TimelineService:
 
         for scene in scenes:
             # Get highest scoring accepted or pending take
-            best_take = db.query(models.Take).filter(
-                models.Take.scene_id == scene.id
-            ).order_by(models.Take.confidence_score.desc()).first()
+            best_take = max(
+                scene.takes,
+                key=lambda t: t.confidence_score or 0.0,
+                default=None
+            )
 
             if not best_take:
                 continue
@@ -2,9 +2,11 @@ import asyncio
 import logging
 import os
 import imageio_ffmpeg
-from app.db.session import SessionLocal
+from sqlalchemy import select
+from app.db.session import AsyncSessionLocal
 from app.models import database as models
 from app.services.orchestrator import orchestrator
+from app.services.semantic_search_service import semantic_search_service
 
 # Ensure ffmpeg for librosa
 ffmpeg_exe = imageio_ffmpeg.get_ffmpeg_exe()
@@ -18,27 +20,43 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-async def main():
-    db = SessionLocal()
-    try:
-        takes = db.query(models.Take).all()
-        logger.info(f"Found {len(takes)} takes to re-process.")
-        
-        for take in takes:
-            logger.info(f"--- STARTING TAKE {take.id}: {take.file_name} ---")
-            # Reset metadata to ensure fresh start
+# How many takes to process at once. The stages are I/O-heavy (whisper,
+# librosa, DB commits), so a small pool overlaps most of the waiting.
+CONCURRENCY = 4
+
+async def reprocess_take(take_id: int, file_name: str, sem: asyncio.Semaphore):
+    async with sem:
+        logger.info(f"--- STARTING TAKE {take_id}: {file_name} ---")
+
+        # Reset metadata to ensure fresh start (own session per task)
+        async with AsyncSessionLocal() as db:
+            take = await db.get(models.Take, take_id)
+            if not take:
+                logger.warning(f"Take {take_id} disappeared, skipping.")
+                return
             take.ai_metadata = {}
             take.ai_reasoning = {}
             db.add(take)
-            db.commit()
-            
-            await orchestrator.process_take(take.id)
-            logger.info(f"--- COMPLETED TAKE {take.id} ---")
-            
+            await db.commit()
+
+        await orchestrator.process_take(take_id)
+        logger.info(f"--- COMPLETED TAKE {take_id} ---")
+
+async def main():
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(models.Take.id, models.Take.file_name))
+        take_info = result.all()
+
+    logger.info(f"Found {len(take_info)} takes to re-process.")
+
+    sem = asyncio.Semaphore(CONCURRENCY)
+    try:
+        await asyncio.gather(*(reprocess_take(tid, name, sem) for tid, name in take_info))
     except Exception as e:
         logger.error(f"Reprocess failed: {e}")
     finally:
-        db.close()
+        # Index saves are debounced during the run; flush whatever is left
+        semantic_search_service.save_index(force=True)
 
 if __name__ == "__main__":
     asyncio.run(main())
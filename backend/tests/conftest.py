@@ -0,0 +1,8 @@
+import os
+import sys
+
+# Point the app at in-memory SQLite before any test imports app modules —
+# app.db.session builds its engines at import time from DATABASE_URL, and the
+# Postgres default would fail collection on machines without psycopg2.
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
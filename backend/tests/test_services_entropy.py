@@ -2,7 +2,6 @@ import sys
 import os
 import pytest
 import asyncio
-from unittest.mock import MagicMock
 
 # Add backend to sys.path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
@@ -13,17 +12,12 @@ from app.services.cv_service import cv_service
 @pytest.mark.asyncio
 async def test_audio_analysis_variety():
     """Verify that different file paths produce different audio analysis results."""
-    # Test with 5 different 'files' (using paths that will hash differently)
+    # Test with 5 different 'files' (using paths that will hash differently),
+    # analyzed concurrently to keep test wall-time down
     paths = [f"test_audio_{i}.mp4" for i in range(5)]
-    results = []
-    
-    for path in paths:
-        # Mocking os.stat and getmtime to ensure consistent but different seeds for test stability
-        with MagicMock() as mock_stat:
-            # We don't actually need to mock stats if we just want to see variety from path hash
-            res = await audio_service.analyze_audio(path)
-            results.append(res)
-            
+    results = await asyncio.gather(*(audio_service.analyze_audio(p) for p in paths))
+
+
     # Check for variety in transcripts and descriptions
     transcripts = [r["transcript"] for r in results]
     descriptions = [r["audio_description"] for r in results]
@@ -36,15 +30,11 @@ async def test_audio_analysis_variety():
 @pytest.mark.asyncio
 async def test_video_analysis_variety():
     """Verify that different file paths produce different video analysis results."""
+    # We're testing the FALLBACK path mainly (where CV2_AVAILABLE might be false)
     paths = [f"test_video_{i}.mp4" for i in range(5)]
-    results = []
-    
-    for path in paths:
-        # We need to mock os.path.exists for cv_service if it's not available
-        # But we're testing the FALLBACK path mainly (where CV2_AVAILABLE might be false)
-        res = await cv_service.analyze_video(path)
-        results.append(res)
-        
+    results = await asyncio.gather(*(cv_service.analyze_video(p) for p in paths))
+
+
     narratives = [r["video_description"] for r in results]
     objects = [tuple(r["objects"]) for r in results]
     